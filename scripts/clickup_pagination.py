@@ -0,0 +1,81 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import pandas as pd
+
+
+# Number of pages kept in flight while walking a paged ClickUp endpoint
+PREFETCH_PAGES = 4
+# Expected page size, only used to detect the final page when 'last_page' is missing
+PAGE_SIZE = 100
+
+
+def iter_pages(fetch_page, items_key, prefetch=PREFETCH_PAGES, page_size=PAGE_SIZE):
+    """Yield paged ClickUp responses in order, prefetching pages in parallel.
+
+    fetch_page(page) requests a single page and returns the parsed JSON (or None
+    for an empty response). Page 0 is fetched on its own and the window of
+    parallel requests grows by one with every page, up to prefetch, so short
+    lists cost about as many requests as a sequential walk. Iteration stops on an
+    empty page or on 'last_page'; when a response has no 'last_page' key, a page
+    shorter than page_size is taken as the last one. Requests already sent past
+    the end still complete and their results are thrown away.
+    """
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    pending = deque([executor.submit(fetch_page, 0)])
+    next_page = 1
+    pages_seen = 0
+    try:
+        while pending:
+            data = pending.popleft().result()
+            if not data or not data.get(items_key):  # No more items past this page
+                break
+            # Trust ClickUp's end-of-list flag when present, short pages can occur mid-list
+            if 'last_page' in data:
+                is_last = bool(data['last_page'])
+            else:
+                is_last = len(data[items_key]) < page_size
+            if is_last:
+                yield data
+                break
+            pages_seen += 1
+            # Widen the window and keep it full while the consumer handles this page
+            while len(pending) < min(prefetch, pages_seen):
+                pending.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+            yield data
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_all_tasks_from_list(list_id, auth_clickup):
+    def fetch_page(page):
+        # Include subtasks and closed tasks in the request
+        url = f"https://api.clickup.com/api/v2/list/{list_id}/task?archived=false&subtasks=true&include_closed=true&page={page}"
+        response = requests.get(url, headers={"Authorization": auth_clickup})
+
+        # Check if the request was successful, so an error payload is never read as the end of the list
+        if response.status_code != 200:
+            print(f"Error: API request failed with status code {response.status_code}")
+            print(f"Response text: {response.text}")
+            raise Exception(f"ClickUp API request failed with status {response.status_code}: {response.text}")
+
+        # Check if response has content before trying to parse JSON
+        if not response.text.strip():
+            print("Error: Empty response from API")
+            return None
+
+        try:
+            response_data = response.json()
+        except requests.exceptions.JSONDecodeError as e:
+            print(f"Error: Failed to parse JSON response: {e}")
+            print(f"Response text: {response.text}")
+            raise Exception(f"Failed to parse API response as JSON: {e}")
+        return response_data
+
+    all_tasks = []  # List to store all tasks across pages
+    # Pages are prefetched in parallel and yielded in order until the list is exhausted
+    for response_data in iter_pages(fetch_page, 'tasks'):
+        all_tasks.extend(response_data['tasks'])  # Add the tasks from the current page to the list
+    return pd.json_normalize(all_tasks)  # Convert all tasks into a DataFrame
@@ -0,0 +1,73 @@
+import time
+
+import pandas as pd
+from gspread.exceptions import APIError
+
+
+def process_custom_fields(tasks_df):
+    # Handle empty DataFrame case
+    if tasks_df.empty:
+        return tasks_df
+
+    custom_fields_data = []
+
+    for _, task in tasks_df.iterrows():
+        task_custom_fields = {'id': task['id']}
+
+        for field in task['custom_fields']:
+            field_name = field['name']
+            if field['type'] == 'drop_down' and 'options' in field['type_config']:
+                # Map the drop_down value (orderindex) to the corresponding name
+                selected_option_index = field.get('value', None)
+                options = field['type_config']['options']
+                # Find the option name by matching the orderindex since 'value' appears to correspond to orderindex
+                selected_option = next((opt['name'] for opt in options if str(opt['orderindex']) == str(selected_option_index)), None)
+                task_custom_fields[field_name] = selected_option
+            elif 'value' in field:
+                # Process other types of fields as before
+                task_custom_fields[field_name] = field['value']
+            else:
+                # Handle fields with no value or different configurations
+                task_custom_fields[field_name] = None
+
+        custom_fields_data.append(task_custom_fields)
+
+    custom_fields_df = pd.DataFrame(custom_fields_data)
+    return tasks_df.merge(custom_fields_df, on='id')
+
+
+def to_sheet_values(processed_df, columns_to_keep):
+    # This avoids KeyErrors if some custom fields are missing for some tasks
+    final_df = processed_df.reindex(columns=columns_to_keep).fillna('')
+    # Convert DataFrame to a list of lists, including the header, for Google Sheets update
+    return [final_df.columns.tolist()] + final_df.values.tolist()
+
+
+def update_sheet(open_worksheet, values_to_update, label):
+    # Set up retry parameters
+    max_retries = 5
+    delay = 2  # initial delay in seconds
+
+    for attempt in range(max_retries):
+        try:
+            # Try to open the spreadsheet and access the desired worksheet
+            sheet = open_worksheet()
+
+            # Clear existing contents of the sheet before updating with new data
+            sheet.clear()
+
+            # Update Google Sheet starting from cell A1
+            sheet.update(values=values_to_update, range_name='A1')
+
+            print(f"{label}: Google Sheet updated successfully.")
+            return
+        except APIError as e:
+            # Check if the error message indicates a 503 Service Unavailable
+            if '503' in str(e):
+                print(f"{label}: attempt {attempt+1}/{max_retries}: Google Sheets service unavailable. Retrying in {delay} seconds...")
+                time.sleep(delay)
+                delay *= 2  # Exponential backoff
+            else:
+                # If it's not a 503 error, re-raise the exception.
+                raise
+    raise Exception(f"{label}: failed to update Google Sheets after several retries.")
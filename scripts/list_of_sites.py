@@ -1,75 +1,13 @@
 import os
-import requests
 import pandas as pd
 import json
 
 from oauth2client.service_account import ServiceAccountCredentials
 import gspread
 
-def get_all_tasks_from_list(list_id, auth_clickup):
-    all_tasks = []  # List to store all tasks across pages
-    page = 0  # Start from first page
-    while True:  # Keep looping until break is called
-        # Include subtasks and closed tasks in the request
-        url = f"https://api.clickup.com/api/v2/list/{list_id}/task?archived=false&subtasks=true&include_closed=true&page={page}"
-        response = requests.get(url, headers={"Authorization": auth_clickup})
-        
-        # Check if the request was successful
-        if response.status_code != 200:
-            print(f"Error: API request failed with status code {response.status_code}")
-            print(f"Response text: {response.text}")
-            raise Exception(f"ClickUp API request failed with status {response.status_code}: {response.text}")
-        
-        # Check if response has content before trying to parse JSON
-        if not response.text.strip():
-            print("Error: Empty response from API")
-            break
-            
-        try:
-            response_data = response.json()
-        except requests.exceptions.JSONDecodeError as e:
-            print(f"Error: Failed to parse JSON response: {e}")
-            print(f"Response text: {response.text}")
-            raise Exception(f"Failed to parse API response as JSON: {e}")
-        
-        tasks = response_data.get('tasks', [])
-        if not tasks:  # Break the loop if no more tasks are returned
-            break
-        all_tasks.extend(tasks)  # Add the tasks from the current page to the list
-        page += 1  # Move to the next page
-    return pd.json_normalize(all_tasks)  # Convert all tasks into a DataFrame
-
-
-def process_custom_fields(tasks_df):
-    # Handle empty DataFrame case
-    if tasks_df.empty:
-        return tasks_df
-    
-    custom_fields_data = []
-
-    for _, task in tasks_df.iterrows():
-        task_custom_fields = {'id': task['id']}
-
-        for field in task['custom_fields']:
-            field_name = field['name']
-            if field['type'] == 'drop_down' and 'options' in field['type_config']:
-                # Map the drop_down value (orderindex) to the corresponding name
-                selected_option_index = field.get('value', None)
-                options = field['type_config']['options']
-                # Find the option name by matching the orderindex since 'value' appears to correspond to orderindex
-                selected_option = next((opt['name'] for opt in options if str(opt['orderindex']) == str(selected_option_index)), None)
-                task_custom_fields[field_name] = selected_option
-            elif 'value' in field:
-                # Process other types of fields as before
-                task_custom_fields[field_name] = field['value']
-            else:
-                # Handle fields with no value or different configurations
-                task_custom_fields[field_name] = None
-
-        custom_fields_data.append(task_custom_fields)
-
-    custom_fields_df = pd.DataFrame(custom_fields_data)
-    return tasks_df.merge(custom_fields_df, on='id')
+from clickup_pagination import get_all_tasks_from_list
+from export_helpers import process_custom_fields
+
 
 # Define the scope
 scope = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
@@ -0,0 +1,105 @@
+import os
+import pandas as pd
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from oauth2client.service_account import ServiceAccountCredentials
+import gspread
+
+from clickup_pagination import get_all_tasks_from_list
+from export_helpers import process_custom_fields, to_sheet_values, update_sheet
+
+
+# Combined export for list 54932029: fetches and flattens the list once, then
+# derives both the "Websites" and the "List of Sites" tabs from that snapshot.
+
+# Define the scope
+scope = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
+
+# Load credentials
+clickup_api_key = os.getenv('CLICKUP_API_KEY_2') or os.getenv('CLICKUP_API_KEY')
+if not clickup_api_key:
+    try:
+        clickup_api_key = json.load(open('../credentials.json'))['clickup']['api_key_2']
+    except (FileNotFoundError, KeyError) as e:
+        raise Exception(f"ClickUp API key not found in environment variables or credentials file: {e}")
+
+if not clickup_api_key:
+    raise Exception("ClickUp API key is empty or not set")
+
+auth_clickup = clickup_api_key
+list_id = '54932029'  # Replace with your list ID
+
+service_account_info = os.getenv('GOOGLE_SERVICE_ACCOUNT')
+if not service_account_info:
+    try:
+        service_account_info = json.load(open('../credentials.json'))['google']['service_account']
+    except (FileNotFoundError, KeyError) as e:
+        raise Exception(f"Google service account info not found in environment variables or credentials file: {e}")
+
+# Check if the environment variable is a string and parse it as JSON
+if service_account_info and isinstance(service_account_info, str):
+    service_account_info = json.loads(service_account_info)
+
+# "Websites" tab: tasks in 'approval' status only
+websites_spreadsheet = 'Popular media by forex/CFD and Crypto'
+websites_tab = "Websites"
+websites_columns = [
+    "id", "name", "Reviews", "Article", "Listing price from",
+    "Payment frequency", "Example Reviews", "Example Articles",
+    "Example Listing", "Update", "Media Kit", "Comments Media"
+]
+
+# "List of Sites" tab: every task in the list
+list_of_sites_url = 'https://docs.google.com/spreadsheets/d/1o4w3ppIcA8iF-4vx6LCRiHFpVI1fHC7dwe7IiQoOb08/edit?gid=0#gid=0'
+list_of_sites_tab = 'List of Sites'
+list_of_sites_columns = [
+    "id", "name", "Media Reviews", "Article", "Listing price from",
+    "Payment frequency", "Example Reviews", "Example Articles",
+    "Example Listing", "Update", "Media Kit", "Comments Media", "Publishing features",
+    "For Task Generation", "Создание аккаунтов",
+]
+
+# Fetch the list once; both outputs are derived from this single snapshot
+print(f"Fetching tasks from ClickUp list ID: {list_id}")
+tasks_df = get_all_tasks_from_list(list_id, auth_clickup)
+print(f"Successfully fetched {len(tasks_df)} tasks")
+
+if tasks_df.empty:
+    print("No tasks found in the list. Exiting.")
+    exit(0)
+
+# Flatten custom fields once for the whole list
+processed_tasks_df = process_custom_fields(tasks_df)
+
+# Convert specific columns to numeric values. Errors='coerce' will turn non-convertible values to NaN, which Google Sheets interprets as empty cells.
+for column in ['Reviews', 'Article', 'Listing price from']:
+    if column in processed_tasks_df.columns:
+        processed_tasks_df[column] = pd.to_numeric(processed_tasks_df[column], errors='coerce')
+
+# Filter tasks by status for the "Websites" tab
+approval_tasks_df = processed_tasks_df[processed_tasks_df['status.status'] == 'approval']
+print(f"Found {len(approval_tasks_df)} tasks with 'approval' status")
+
+websites_values = to_sheet_values(approval_tasks_df, websites_columns)
+list_of_sites_values = to_sheet_values(processed_tasks_df, list_of_sites_columns)
+
+# Writing the data into both Google Sheets files concurrently
+creds = ServiceAccountCredentials.from_json_keyfile_dict(service_account_info, scope)
+
+
+def write_websites():
+    client = gspread.authorize(creds)
+    update_sheet(lambda: client.open(websites_spreadsheet).worksheet(websites_tab), websites_values, websites_tab)
+
+
+def write_list_of_sites():
+    client = gspread.authorize(creds)
+    update_sheet(lambda: client.open_by_url(list_of_sites_url).worksheet(list_of_sites_tab), list_of_sites_values, list_of_sites_tab)
+
+
+with ThreadPoolExecutor(max_workers=2) as executor:
+    futures = [executor.submit(write_websites), executor.submit(write_list_of_sites)]
+    # Re-raise any failure from either write
+    for future in futures:
+        future.result()